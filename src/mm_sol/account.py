@@ -1,9 +1,11 @@
 """Solana account management: key generation, derivation, and validation."""
 
 import contextlib
+import functools
+import json
+import re
 from dataclasses import dataclass
 
-import base58
 from mnemonic import Mnemonic
 from pydantic import BaseModel
 from solders.keypair import Keypair
@@ -15,6 +17,12 @@ PHANTOM_DERIVATION_PATH = "m/44'/501'/{i}'/0'"
 WORD_STRENGTH = {12: 128, 15: 160, 18: 192, 21: 224, 24: 256}
 """Mapping of mnemonic word count to entropy bits."""
 
+_MNEMONIC_EN = Mnemonic("english")
+"""Shared English BIP39 wordlist, loaded once at import."""
+
+_ADDRESS_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+"""Base58 alphabet and length range of a 32-byte public key, used to reject invalid addresses cheaply."""
+
 
 class NewAccount(BaseModel):
     """Newly generated Solana account with public and private keys."""
@@ -38,8 +46,13 @@ def generate_mnemonic(num_words: int = 24) -> str:
     """Generate a BIP39 mnemonic phrase with the specified number of words."""
     if num_words not in WORD_STRENGTH:
         raise ValueError(f"num_words must be one of {list(WORD_STRENGTH.keys())}")
-    mnemonic = Mnemonic("english")
-    return mnemonic.generate(strength=WORD_STRENGTH[num_words])
+    return _MNEMONIC_EN.generate(strength=WORD_STRENGTH[num_words])
+
+
+@functools.lru_cache(maxsize=32)
+def _mnemonic_to_seed(mnemonic: str, passphrase: str) -> bytes:
+    """Return the BIP39 seed for a mnemonic and passphrase."""
+    return Mnemonic.to_seed(mnemonic, passphrase)
 
 
 def derive_accounts(mnemonic: str, passphrase: str, derivation_path: str, limit: int) -> list[DerivedAccount]:
@@ -47,79 +60,68 @@ def derive_accounts(mnemonic: str, passphrase: str, derivation_path: str, limit:
     if "{i}" not in derivation_path:
         raise ValueError("derivation_path must contain {i}, for example: m/44'/501'/{i}'/0'")
 
-    result: list[DerivedAccount] = []
-    seed = Mnemonic.to_seed(mnemonic, passphrase)
-    for i in range(limit):
-        path = derivation_path.replace("{i}", str(i))
-        keypair = Keypair.from_seed_and_derivation_path(seed, path)
-        result.append(
-            DerivedAccount(
-                index=i,
-                path=path,
-                address=str(keypair.pubkey()),
-                private_key=base58.b58encode(bytes(keypair.to_bytes())).decode("utf-8"),
-            )
-        )
-
-    return result
+    seed = _mnemonic_to_seed(mnemonic, passphrase)
+    path_parts = derivation_path.split("{i}")  # split the template once instead of scanning it per index
+    paths = [str(i).join(path_parts) for i in range(limit)]
+    keypairs = [Keypair.from_seed_and_derivation_path(seed, path) for path in paths]
+    return [
+        DerivedAccount(index=i, path=path, address=str(keypair.pubkey()), private_key=str(keypair))
+        for i, (path, keypair) in enumerate(zip(paths, keypairs, strict=True))
+    ]
 
 
 def generate_account() -> NewAccount:
     """Generate a new random Solana keypair and return it as a NewAccount."""
     keypair = Keypair()
     public_key = str(keypair.pubkey())
-    private_key_base58 = base58.b58encode(bytes(keypair.to_bytes())).decode("utf-8")
+    private_key_base58 = str(keypair)
     private_key_arr = list(keypair.to_bytes())
     return NewAccount(public_key=public_key, private_key_base58=private_key_base58, private_key_arr=private_key_arr)
 
 
-def get_keypair(private_key: str | list[int]) -> Keypair:
-    """Create a Keypair from a base58 string, JSON array string, or integer list."""
+def get_keypair(private_key: str | list[int] | Keypair) -> Keypair:
+    """Create a Keypair from a base58 string, JSON array string, or integer list. A Keypair is returned as is."""
+    if isinstance(private_key, Keypair):
+        return private_key
     if isinstance(private_key, str):
-        if "[" in private_key:
-            private_key_ = [int(x) for x in private_key.replace("[", "").replace("]", "").split(",")]
-        else:
-            private_key_ = base58.b58decode(private_key)  # type: ignore[assignment]
-    else:
-        private_key_ = private_key
-    return Keypair.from_bytes(private_key_)
+        private_key = private_key.strip()
+        if private_key.startswith("["):  # the first character tells JSON-array keys from base58 ones
+            return Keypair.from_bytes(json.loads(private_key))
+        return Keypair.from_base58_string(private_key)
+    return Keypair.from_bytes(private_key)
 
 
-def check_private_key(public_key: str | Pubkey, private_key: str | list[int]) -> bool:
+def check_private_key(public_key: str | Pubkey, private_key: str | list[int] | Keypair) -> bool:
     """Check whether a private key corresponds to the given public key."""
     if isinstance(public_key, str):
         public_key = Pubkey.from_string(public_key)
     return get_keypair(private_key).pubkey() == public_key
 
 
-def get_public_key(private_key: str) -> str:
+def get_public_key(private_key: str | Keypair) -> str:
     """Derive the public key address from a private key string."""
-    if "[" in private_key:
-        private_key_ = [int(x) for x in private_key.replace("[", "").replace("]", "").split(",")]
-    else:
-        private_key_ = base58.b58decode(private_key)  # type: ignore[assignment]
-    return str(Keypair.from_bytes(private_key_).pubkey())
+    return str(get_keypair(private_key).pubkey())
 
 
-def get_private_key_base58(private_key: str) -> str:
+def get_private_key_base58(private_key: str | Keypair) -> str:
     """Convert a private key to base58 encoding."""
-    keypair = get_keypair(private_key)
-    return base58.b58encode(bytes(keypair.to_bytes())).decode("utf-8")
+    return str(get_keypair(private_key))
 
 
-def get_private_key_arr(private_key: str) -> list[int]:
+def get_private_key_arr(private_key: str | Keypair) -> list[int]:
     """Convert a private key to a list of byte integers."""
-    keypair = get_keypair(private_key)
-    return list(x for x in keypair.to_bytes())  # noqa: C400
+    return list(get_keypair(private_key).to_bytes())
 
 
-def get_private_key_arr_str(private_key: str) -> str:
+def get_private_key_arr_str(private_key: str | Keypair) -> str:
     """Convert a private key to a JSON-style array string."""
-    return f"[{','.join(str(x) for x in get_private_key_arr(private_key))}]"
+    return json.dumps(get_private_key_arr(private_key), separators=(",", ":"))
 
 
 def is_address(pubkey: str) -> bool:
     """Check whether a string is a valid Solana address."""
+    if not _ADDRESS_RE.fullmatch(pubkey):
+        return False
     with contextlib.suppress(Exception):
         Pubkey.from_string(pubkey)
         return True
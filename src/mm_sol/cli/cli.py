@@ -1,6 +1,5 @@
 """Main CLI entry point and command definitions for mm-sol."""
 
-import asyncio
 from enum import StrEnum
 from pathlib import Path
 from typing import Annotated
@@ -10,6 +9,7 @@ from mm_clikit import TyperPlus
 
 from mm_sol.account import PHANTOM_DERIVATION_PATH
 
+from . import cli_utils
 from .cmd import balance_cmd, balances_cmd, example_cmd, node_cmd, transfer_cmd
 from .cmd.transfer_cmd import TransferCmdParams
 from .cmd.wallet import keypair_cmd, mnemonic_cmd
@@ -47,7 +47,7 @@ def balance_command(
     lamport: bool = typer.Option(False, "--lamport", "-l", help="Print balances in lamports"),
 ) -> None:
     """Fetch and print SOL and optional token balance for an account."""
-    asyncio.run(balance_cmd.run(rpc_url, wallet_address, token_address, lamport, proxies_url))
+    cli_utils.run_command(balance_cmd.run(rpc_url, wallet_address, token_address, lamport, proxies_url))
 
 
 @app.command(name="balances", help="Displays SOL and token balances for multiple accounts")
@@ -55,7 +55,7 @@ def balances_command(
     config_path: Path, print_config: Annotated[bool, typer.Option("--config", "-c", help="Print config and exit")] = False
 ) -> None:
     """Display SOL and token balances for multiple accounts from a config file."""
-    asyncio.run(balances_cmd.run(config_path, print_config))
+    cli_utils.run_command(balances_cmd.run(config_path, print_config))
 
 
 @app.command(name="transfer", help="Transfers SOL or SPL tokens, supporting multiple routes, delays, and expression-based values")
@@ -70,7 +70,7 @@ def transfer_command(
     debug: bool = typer.Option(False, "--debug", "-d", help="Print debug info"),
 ) -> None:
     """Execute SOL or SPL token transfers based on a config file."""
-    asyncio.run(
+    cli_utils.run_command(
         transfer_cmd.run(
             TransferCmdParams(
                 config_path=config_path,
@@ -92,7 +92,7 @@ def node_command(
     proxy: Annotated[str | None, typer.Option("--proxy", "-p", help="Proxy")] = None,
 ) -> None:
     """Check RPC node availability by fetching block height."""
-    asyncio.run(node_cmd.run(urls, proxy))
+    cli_utils.run_command(node_cmd.run(urls, proxy))
 
 
 @wallet_app.command(name="mnemonic", help="Derive accounts from a mnemonic")
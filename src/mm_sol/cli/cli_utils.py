@@ -1,14 +1,27 @@
 """Shared CLI utilities: config printing, RPC URL resolution, and helpers."""
 
+import asyncio
+import functools
+import importlib.metadata
 import time
+from collections.abc import Awaitable, Coroutine, Iterable
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
 from mm_web3 import Nodes, Proxies, random_node, random_proxy
 from pydantic import BaseModel
+from solana.rpc.async_api import AsyncClient
 from solders.signature import Signature
 
-from mm_sol.utils import get_client
+from mm_sol.utils import close_async_clients, get_async_client
+
+_PUBLIC_RPC_URLS = {
+    "mainnet": "https://api.mainnet-beta.solana.com",
+    "testnet": "https://api.testnet.solana.com",
+    "devnet": "https://api.devnet.solana.com",
+}
+"""Public RPC URLs by network shorthand."""
 
 
 class BaseConfigParams(BaseModel):
@@ -18,37 +31,64 @@ class BaseConfigParams(BaseModel):
     print_config_and_exit: bool
 
 
+@functools.cache
+def get_version() -> str:
+    """Return the installed mm-sol version, read from package metadata once per process."""
+    return importlib.metadata.version("mm-sol")
+
+
 def public_rpc_url(url: str | None) -> str:
     """Resolve a shorthand network name (mainnet/testnet/devnet) to its full RPC URL."""
     if not url:
-        return "https://api.mainnet-beta.solana.com"
+        return _PUBLIC_RPC_URLS["mainnet"]
+    return _PUBLIC_RPC_URLS.get(url.lower(), url)
+
+
+def max_concurrency(proxies: list[str]) -> int:
+    """Return how many RPC requests a command may run at once for the given proxy list."""
+    return min(32, len(proxies) or 8)
+
+
+def run_command[T](command: Coroutine[Any, Any, T]) -> T:
+    """Run an async command in a new event loop, closing cached RPC clients before the loop shuts down."""
+
+    async def main() -> T:
+        try:
+            return await command
+        finally:
+            await close_async_clients()
+
+    return asyncio.run(main())
+
+
+def create_limited_tasks[T](aws: Iterable[Awaitable[T]], limit: int) -> list[asyncio.Task[T]]:
+    """Schedule all awaitables as tasks that run at most limit at a time, returning the tasks in input order."""
+    semaphore = asyncio.Semaphore(limit)
 
-    match url.lower():
-        case "mainnet":
-            return "https://api.mainnet-beta.solana.com"
-        case "testnet":
-            return "https://api.testnet.solana.com"
-        case "devnet":
-            return "https://api.devnet.solana.com"
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
 
-    return url
+    return [asyncio.create_task(run(aw)) for aw in aws]
 
 
-def wait_confirmation(nodes: Nodes, proxies: Proxies, signature: Signature, log_prefix: str) -> bool:
-    """Poll for transaction confirmation, returning True if confirmed within 30 seconds."""
-    count = 0
+async def wait_confirmation(nodes: Nodes, proxies: Proxies, signature: Signature, log_prefix: str, timeout: float = 30) -> bool:
+    """Poll for transaction confirmation with exponential backoff, returning True if confirmed within timeout seconds."""
+    started_at = time.monotonic()
+    delay = 0.2
+    client: AsyncClient | None = None
     while True:
+        if client is None:  # the same node and proxy are reused between polls until a request fails
+            client = get_async_client(random_node(nodes), proxy=random_proxy(proxies))
         try:
-            node = random_node(nodes)
-            proxy = random_proxy(proxies)
-            client = get_client(node, proxy=proxy)
-            res = client.get_transaction(signature)
+            res = await client.get_transaction(signature)
             if res.value and res.value.slot:  # check for tx error
                 return True
         except Exception as e:
             logger.error(f"{log_prefix}: can't get confirmation, error={e}")
-        time.sleep(1)
-        count += 1
-        if count > 30:
+            client = None
+        if time.monotonic() - started_at > timeout:
             logger.error(f"{log_prefix}: can't get confirmation, timeout")
             return False
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 2.0)
@@ -1,12 +1,12 @@
 """Single account balance query command."""
 
+import asyncio
 from decimal import Decimal
 
 from mm_clikit import print_json
 from mm_web3 import fetch_proxies
 from pydantic import BaseModel, Field
 
-import mm_sol.retry
 from mm_sol import retry
 from mm_sol.cli import cli_utils
 
@@ -53,8 +53,20 @@ async def run(
 
     proxies = (await fetch_proxies(proxies_url)).unwrap() if proxies_url else None
 
+    # sol balance, token balance and token decimals are independent, so they are fetched concurrently
+    token_requests = (
+        [
+            retry.get_token_balance(3, rpc_url, proxies, owner=wallet_address, token=token_address),
+            retry.get_token_decimals(3, rpc_url, proxies, token=token_address),
+        ]
+        if token_address
+        else []
+    )
+    sol_balance_res, *token_results = await asyncio.gather(
+        retry.get_sol_balance(3, rpc_url, proxies, address=wallet_address), *token_requests
+    )
+
     # sol balance
-    sol_balance_res = await retry.get_sol_balance(3, rpc_url, proxies, address=wallet_address)
     if sol_balance_res.is_ok():
         result.sol_balance = sol_balance_res.unwrap()
     else:
@@ -62,14 +74,13 @@ async def run(
 
     # token balance
     if token_address:
-        token_balance_res = await mm_sol.retry.get_token_balance(3, rpc_url, proxies, owner=wallet_address, token=token_address)
+        token_balance_res, decimals_res = token_results
 
         if token_balance_res.is_ok():
             result.token_balance = token_balance_res.unwrap()
         else:
             result.errors.append("token_balance: " + token_balance_res.unwrap_err())
 
-        decimals_res = await mm_sol.retry.get_token_decimals(3, rpc_url, proxies, token=token_address)
         if decimals_res.is_ok():
             result.token_decimals = decimals_res.unwrap()
         else:
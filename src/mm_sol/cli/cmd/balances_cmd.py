@@ -1,5 +1,6 @@
 """Multi-account balances query command."""
 
+import asyncio
 import random
 from decimal import Decimal
 from pathlib import Path
@@ -9,7 +10,6 @@ from mm_clikit import TomlConfig, fatal, print_json
 from mm_web3 import ConfigValidators
 from pydantic import BeforeValidator, Field
 
-import mm_sol.retry
 from mm_sol import converters, retry
 from mm_sol.cli.validators import Validators
 
@@ -38,13 +38,18 @@ async def run(config_path: Path, print_config: bool) -> None:
     result["sol_sum"] = sum([v for v in result["sol"].values() if v is not None])
 
     if config.tokens:
-        for token_address in config.tokens:
-            res = await mm_sol.retry.get_token_decimals(3, config.nodes, config.proxies, token=token_address)
+        decimals_results = await asyncio.gather(
+            *(retry.get_token_decimals(3, config.nodes, config.proxies, token=token) for token in config.tokens)
+        )
+        tokens_decimals: dict[str, int] = {}
+        for token_address, res in zip(config.tokens, decimals_results, strict=True):
             if res.is_err():
                 fatal(f"Failed to get decimals for token {token_address}: {res.unwrap_err()}")
+            tokens_decimals[token_address] = res.unwrap()
 
-            token_decimals = res.unwrap()
-            result[token_address] = await _get_token_balances(token_address, token_decimals, config.accounts, config)
+        tokens_balances = await _get_token_balances(tokens_decimals, config.accounts, config)
+        for token_address, token_decimals in tokens_decimals.items():
+            result[token_address] = tokens_balances[token_address]
             result[token_address + "_decimals"] = token_decimals
             result[token_address + "_sum"] = sum([v for v in result[token_address].values() if v is not None])
 
@@ -52,26 +57,22 @@ async def run(config_path: Path, print_config: bool) -> None:
 
 
 async def _get_token_balances(
-    token_address: str, token_decimals: int, accounts: list[str], config: Config
-) -> dict[str, Decimal | None]:
-    """Fetch token balances for all accounts, returning a dict of address to balance."""
-    result: dict[str, Decimal | None] = {}
-    for account in accounts:
-        result[account] = (
-            (await mm_sol.retry.get_token_balance(3, config.nodes, config.proxies, owner=account, token=token_address))
-            .map(lambda v: converters.to_token(v, token_decimals))
-            .value
-        )
-
-    return result
+    tokens_decimals: dict[str, int], accounts: list[str], config: Config
+) -> dict[str, dict[str, Decimal | None]]:
+    """Fetch balances of every token for all accounts in batched RPC calls, returning token -> address -> balance."""
+    owners_tokens = [(account, token) for token in tokens_decimals for account in accounts]
+    res = await retry.get_token_balances(3, config.nodes, config.proxies, owners_tokens=owners_tokens)
+    balances: dict[str, dict[str, Decimal | None]] = {token: dict.fromkeys(accounts) for token in tokens_decimals}
+    if res.is_ok():
+        for (account, token), value in zip(owners_tokens, res.unwrap(), strict=True):
+            balances[token][account] = converters.to_token(value, tokens_decimals[token])
+    return balances
 
 
 async def _get_sol_balances(accounts: list[str], config: Config) -> dict[str, Decimal | None]:
     """Fetch SOL balances for all accounts, returning a dict of address to balance."""
-    result = {}
-    for account in accounts:
-        result[account] = (
-            (await retry.get_sol_balance(3, config.nodes, config.proxies, address=account)).map(converters.lamports_to_sol).value
-        )
-
-    return result
+    res = await retry.get_sol_balances(3, config.nodes, config.proxies, addresses=accounts)
+    if res.is_err():
+        result: dict[str, Decimal | None] = dict.fromkeys(accounts)
+        return result
+    return {account: converters.lamports_to_sol(balance) for account, balance in zip(accounts, res.unwrap(), strict=True)}
@@ -1,10 +1,10 @@
 """SOL and SPL token transfer command with multi-route support."""
 
 import asyncio
-import importlib.metadata
 import sys
+from collections.abc import Coroutine
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 from loguru import logger
 from mm_clikit import TomlConfig, fatal
@@ -19,7 +19,6 @@ from rich.live import Live
 from rich.table import Table
 from solders.signature import Signature
 
-import mm_sol.retry
 from mm_sol import retry
 from mm_sol.cli import calcs, cli_utils
 from mm_sol.cli.cli_utils import BaseConfigParams
@@ -95,7 +94,7 @@ async def run(cmd_params: TransferCmdParams) -> None:
 
     # Fetch token decimals (async, can't be done in sync validator)
     if config.token:
-        res = await mm_sol.retry.get_token_decimals(3, config.nodes, config.proxies, token=config.token)
+        res = await retry.get_token_decimals(3, config.nodes, config.proxies, token=config.token)
         if res.is_err():
             fatal(f"can't get decimals for token={config.token}, error={res.unwrap_err()}")
         config.token_decimals = res.unwrap()
@@ -115,8 +114,9 @@ async def _run_transfers(config: Config, cmd_params: TransferCmdParams) -> None:
     """Execute all configured transfer routes sequentially with optional delays."""
     init_loguru(cmd_params.debug, config.log_debug, config.log_info)
     logger.info(f"transfer {cmd_params.config_path}: started at {utc()} UTC")
-    version = importlib.metadata.version("mm-sol")
-    logger.debug(f"config={config.model_dump(exclude={'private_keys'}) | {'version': version}}")
+    logger.opt(lazy=True).debug(
+        "config={}", lambda: config.model_dump(mode="json", exclude={"private_keys"}) | {"version": cli_utils.get_version()}
+    )
     for i, route in enumerate(config.transfers):
         await _transfer(route, config, cmd_params)
         if config.delay is not None and i < len(config.transfers) - 1:
@@ -226,7 +226,7 @@ async def _transfer(transfer: Transfer, config: Config, cmd_params: TransferCmdP
     status = "UNKNOWN"
     if not cmd_params.no_confirmation:
         logger.debug(f"{transfer.log_prefix}: waiting for confirmation, sig={signature}")
-        if cli_utils.wait_confirmation(config.nodes, config.proxies, signature, transfer.log_prefix):
+        if await cli_utils.wait_confirmation(config.nodes, config.proxies, signature, transfer.log_prefix):
             status = "OK"
 
     logger.info(f"{transfer.log_prefix}: sig={signature}, value={_value_with_suffix(value, config)}, status={status}")
@@ -248,12 +248,24 @@ async def _print_balances(config: Config) -> None:
     else:
         headers = ["n", "from_address", "sol", "to_address", "sol"]
     table = Table(*headers, title="balances")
+    addresses = list(dict.fromkeys(address for r in config.transfers for address in (r.from_address, r.to_address)))
     with Live(table, refresh_per_second=0.5):
+        # every RPC lookup is its own limited task, scheduled up front in address order (sol, then token);
+        # rows are added in route order as soon as their balances arrive
+        lookups: list[Coroutine[Any, Any, str]] = []
+        for address in addresses:
+            lookups.append(_get_sol_balance_str(address, config))
+            if config.token:
+                lookups.append(_get_token_balance_str(address, config))
+        tasks = cli_utils.create_limited_tasks(lookups, cli_utils.max_concurrency(config.proxies))
+        stride = 2 if config.token else 1
+        sol_balances = dict(zip(addresses, tasks[::stride], strict=True))
+        token_balances = dict(zip(addresses, tasks[1::stride], strict=True)) if config.token else {}
         for count, route in enumerate(config.transfers):
-            from_sol_balance = await _get_sol_balance_str(route.from_address, config)
-            to_sol_balance = await _get_sol_balance_str(route.to_address, config)
-            from_t_balance = await _get_token_balance_str(route.from_address, config) if config.token else ""
-            to_t_balance = await _get_token_balance_str(route.to_address, config) if config.token else ""
+            from_sol_balance = await sol_balances[route.from_address]
+            to_sol_balance = await sol_balances[route.to_address]
+            from_t_balance = await token_balances[route.from_address] if config.token else ""
+            to_t_balance = await token_balances[route.to_address] if config.token else ""
 
             if config.token:
                 table.add_row(
@@ -285,5 +297,5 @@ async def _get_token_balance_str(address: str, config: Config) -> str:
     """Fetch token balance and return it as a formatted string."""
     if not config.token:
         raise ValueError("token is not set")
-    res = await mm_sol.retry.get_token_balance(5, config.nodes, config.proxies, owner=address, token=config.token)
+    res = await retry.get_token_balance(5, config.nodes, config.proxies, owner=address, token=config.token)
     return res.map(lambda ok: str(to_token(ok, config.token_decimals, ndigits=config.round_ndigits))).value_or_error()
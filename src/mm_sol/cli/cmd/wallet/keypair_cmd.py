@@ -5,6 +5,7 @@ from pathlib import Path
 from mm_clikit import print_json
 
 from mm_sol.account import (
+    get_keypair,
     get_private_key_arr_str,
     get_private_key_base58,
     get_public_key,
@@ -16,7 +17,8 @@ def run(private_key: str) -> None:
     if (file := Path(private_key)).is_file():
         private_key = file.read_text()
 
-    public = get_public_key(private_key)
-    private_base58 = get_private_key_base58(private_key)
-    private_arr = get_private_key_arr_str(private_key)
+    keypair = get_keypair(private_key)
+    public = get_public_key(keypair)
+    private_base58 = get_private_key_base58(keypair)
+    private_arr = get_private_key_arr_str(keypair)
     print_json({"public": public, "private_base58": private_base58, "private_arr": private_arr})
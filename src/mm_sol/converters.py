@@ -1,25 +1,38 @@
 """Conversion utilities between SOL, lamports, and token smallest units."""
 
-from decimal import Decimal
+import functools
+from decimal import Decimal, localcontext
+
+from mm_sol.constants import UNIT_DECIMALS
+
+
+@functools.cache
+def _quantum(ndigits: int) -> Decimal:
+    """Return the Decimal exponent used to round to ndigits decimal places."""
+    return Decimal(1).scaleb(-ndigits)
+
+
+def _scale_down(value: int, decimals: int, ndigits: int) -> Decimal:
+    """Return value / 10**decimals rounded to ndigits decimal places."""
+    with localcontext() as ctx:
+        # the default 28-digit precision is too small for large amounts rounded to many decimal places
+        ctx.prec = max(ctx.prec, len(str(abs(value))) + max(ndigits, 0) + 1)
+        return Decimal(value).scaleb(-decimals).quantize(_quantum(ndigits))
 
 
 def lamports_to_sol(lamports: int, ndigits: int = 4) -> Decimal:
     """Convert lamports to SOL with the specified decimal precision."""
-    if lamports == 0:
-        return Decimal(0)
-    return Decimal(str(round(lamports / 10**9, ndigits=ndigits)))
+    return _scale_down(lamports, UNIT_DECIMALS["sol"], ndigits)
 
 
 def to_token(smallest_unit_value: int, decimals: int, ndigits: int = 4) -> Decimal:
     """Convert a token's smallest unit value to a human-readable Decimal."""
-    if smallest_unit_value == 0:
-        return Decimal(0)
-    return Decimal(str(round(smallest_unit_value / 10**decimals, ndigits=ndigits)))
+    return _scale_down(smallest_unit_value, decimals, ndigits)
 
 
 def sol_to_lamports(sol: Decimal) -> int:
     """Convert SOL amount to lamports."""
-    return int(sol * 10**9)
+    return int(sol.scaleb(UNIT_DECIMALS["sol"]))
 
 
 def to_lamports(value: str | int | Decimal, decimals: int | None = None) -> int:
@@ -31,15 +44,15 @@ def to_lamports(value: str | int | Decimal, decimals: int | None = None) -> int:
             raise ValueError(f"value must be integral number: {value}")
         return int(value)
     if isinstance(value, str):
+        if value.isdigit():  # fast path for plain lamport strings, no normalization needed
+            return int(value)
         value = value.lower().replace(" ", "").strip()
         if value.endswith("sol"):
-            value = value.replace("sol", "")
-            return sol_to_lamports(Decimal(value))
+            return sol_to_lamports(Decimal(value[:-3]))
         if value.endswith("t"):
             if decimals is None:
                 raise ValueError("t without decimals")
-            value = value.removesuffix("t")
-            return int(Decimal(value) * 10**decimals)
+            return int(Decimal(value[:-1]).scaleb(decimals))
         if value.isdigit():
             return int(value)
         raise ValueError("wrong value " + value)
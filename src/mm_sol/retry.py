@@ -1,10 +1,19 @@
 """Retry wrappers for Solana RPC calls with node and proxy rotation."""
 
+from collections import OrderedDict
+
 from mm_result import Result
 from mm_web3 import Nodes, Proxies, retry_with_node_and_proxy
 from solders.solders import Pubkey, Signature
 
 from mm_sol import rpc, spl_token, transfer
+from mm_sol.account import get_keypair
+
+TOKEN_DECIMALS_CACHE_SIZE = 1024
+"""Maximum number of (nodes, token) entries kept in the token decimals cache."""
+
+_token_decimals_cache: OrderedDict[tuple[frozenset[str], str], int] = OrderedDict()
+"""Decimals of token mints fetched so far, keyed by node set and mint, least recently used first."""
 
 
 async def get_sol_balance(retries: int, nodes: Nodes, proxies: Proxies, *, address: str, timeout: float = 5) -> Result[int]:
@@ -17,6 +26,18 @@ async def get_sol_balance(retries: int, nodes: Nodes, proxies: Proxies, *, addre
     )
 
 
+async def get_sol_balances(
+    retries: int, nodes: Nodes, proxies: Proxies, *, addresses: list[str], timeout: float = 5
+) -> Result[list[int]]:
+    """Fetch SOL balances in lamports for many addresses in batched RPC calls, with retries across nodes and proxies."""
+    return await retry_with_node_and_proxy(
+        retries,
+        nodes,
+        proxies,
+        lambda node, proxy: rpc.get_balances(node=node, addresses=addresses, timeout=timeout, proxy=proxy),
+    )
+
+
 async def get_token_balance(
     retries: int,
     nodes: Nodes,
@@ -43,6 +64,18 @@ async def get_token_balance(
     )
 
 
+async def get_token_balances(
+    retries: int, nodes: Nodes, proxies: Proxies, *, owners_tokens: list[tuple[str, str]], timeout: float = 5
+) -> Result[list[int]]:
+    """Fetch SPL token balances for many (owner, token) pairs in batched RPC calls, with retries across nodes and proxies."""
+    return await retry_with_node_and_proxy(
+        retries,
+        nodes,
+        proxies,
+        lambda node, proxy: spl_token.get_balances(node, owners_tokens=owners_tokens, timeout=timeout, proxy=proxy),
+    )
+
+
 async def transfer_token(
     retries: int,
     nodes: Nodes,
@@ -58,6 +91,7 @@ async def transfer_token(
     create_token_account_if_not_exists: bool = True,
 ) -> Result[Signature]:
     """Transfer SPL tokens with retries across nodes and proxies."""
+    keypair = get_keypair(private_key)
     return await retry_with_node_and_proxy(
         retries,
         nodes,
@@ -66,7 +100,7 @@ async def transfer_token(
             node=node,
             token_mint_address=token_mint_address,
             from_address=from_address,
-            private_key=private_key,
+            private_key=keypair,
             to_address=to_address,
             amount=amount,
             decimals=decimals,
@@ -89,6 +123,7 @@ async def transfer_sol(
     timeout: float = 10,
 ) -> Result[Signature]:
     """Transfer SOL with retries across nodes and proxies."""
+    keypair = get_keypair(private_key)
     return await retry_with_node_and_proxy(
         retries,
         nodes,
@@ -99,17 +134,27 @@ async def transfer_sol(
             from_address=from_address,
             to_address=to_address,
             lamports=lamports,
-            private_key=private_key,
+            private_key=keypair,
             timeout=timeout,
         ),
     )
 
 
 async def get_token_decimals(retries: int, nodes: Nodes, proxies: Proxies, *, token: str, timeout: float = 5) -> Result[int]:
-    """Fetch token decimals with retries across nodes and proxies."""
-    return await retry_with_node_and_proxy(
+    """Fetch token decimals with retries across nodes and proxies. Successful lookups are cached per nodes and token."""
+    # the same mint address may exist on several clusters, so the nodes are part of the key
+    key = (frozenset([nodes] if isinstance(nodes, str) else nodes), token)
+    if key in _token_decimals_cache:
+        _token_decimals_cache.move_to_end(key)
+        return Result.ok(_token_decimals_cache[key])
+    res = await retry_with_node_and_proxy(
         retries,
         nodes,
         proxies,
         lambda node, proxy: spl_token.get_decimals(node, token=token, proxy=proxy, timeout=timeout),
     )
+    if res.is_ok():
+        _token_decimals_cache[key] = res.unwrap()
+        if len(_token_decimals_cache) > TOKEN_DECIMALS_CACHE_SIZE:
+            _token_decimals_cache.popitem(last=False)
+    return res
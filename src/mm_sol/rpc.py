@@ -8,6 +8,9 @@ import websockets
 from mm_http import http_request
 from mm_result import Result
 
+MAX_MULTIPLE_ACCOUNTS = 100
+"""Maximum number of addresses accepted by a single getMultipleAccounts request."""
+
 
 async def rpc_call(
     node: str,
@@ -71,3 +74,43 @@ async def get_balance(node: str, address: str, timeout: float = 5, proxy: str |
     return (await rpc_call(node=node, method="getBalance", params=[address], timeout=timeout, proxy=proxy)).map(
         lambda r: r["value"]
     )
+
+
+async def get_multiple_accounts(
+    node: str,
+    addresses: Sequence[str],
+    data_slice: tuple[int, int] | None = None,
+    timeout: float = 5,
+    proxy: str | None = None,
+) -> Result[list[dict[str, Any] | None]]:
+    """Return base64-encoded account infos for many addresses, in input order, with None for missing accounts.
+
+    Addresses are sent in getMultipleAccounts batches of MAX_MULTIPLE_ACCOUNTS. data_slice is an (offset, length)
+    pair that limits the returned account data.
+    """
+    config: dict[str, object] = {"encoding": "base64"}
+    if data_slice is not None:
+        config["dataSlice"] = {"offset": data_slice[0], "length": data_slice[1]}
+    res: Result[Any] = Result.ok([])
+    accounts: list[dict[str, Any] | None] = []
+    for i in range(0, len(addresses), MAX_MULTIPLE_ACCOUNTS):
+        params = [list(addresses[i : i + MAX_MULTIPLE_ACCOUNTS]), config]
+        res = await rpc_call(node=node, method="getMultipleAccounts", params=params, timeout=timeout, proxy=proxy)
+        if res.is_err():
+            return res
+        try:
+            accounts.extend(res.unwrap()["value"])
+        except Exception as e:
+            return res.with_error(e)
+    return res.with_value(accounts)
+
+
+async def get_balances(node: str, addresses: Sequence[str], timeout: float = 5, proxy: str | None = None) -> Result[list[int]]:
+    """Return balances in lamports for many addresses, in input order, using batched getMultipleAccounts calls."""
+    res: Result[Any] = await get_multiple_accounts(node, addresses, data_slice=(0, 0), timeout=timeout, proxy=proxy)
+    if res.is_err():
+        return res
+    try:
+        return res.with_value([account["lamports"] if account else 0 for account in res.unwrap()])
+    except Exception as e:
+        return res.with_error(e)
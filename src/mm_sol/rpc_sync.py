@@ -1,11 +1,11 @@
 """Synchronous Solana JSON-RPC client and response models."""
 
+from collections.abc import Sequence
 from typing import Any
 
-import pydash
 from mm_http import http_request_sync
 from mm_result import Result
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 DEFAULT_MAINNET_RPC = "https://api.mainnet-beta.solana.com"
 """Default Solana mainnet RPC endpoint."""
@@ -44,6 +44,8 @@ class ClusterNode(BaseModel):
 class VoteAccount(BaseModel):
     """Validator vote account with stake and credit info."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     class EpochCredits(BaseModel):
         """Credits earned by a validator in a single epoch."""
 
@@ -51,16 +53,22 @@ class VoteAccount(BaseModel):
         credits: int
         previous_credits: int
 
-    validator: str
-    vote: str
+    validator: str = Field(..., alias="nodePubkey")
+    vote: str = Field(..., alias="votePubkey")
     commission: int
-    stake: int
-    credits: list[EpochCredits]
-    epoch_vote_account: bool
-    root_slot: int
-    last_vote: int
+    stake: int = Field(..., alias="activatedStake")
+    credits: list[EpochCredits] = Field(..., alias="epochCredits")
+    epoch_vote_account: bool = Field(..., alias="epochVoteAccount")
+    root_slot: int = Field(..., alias="rootSlot")
+    last_vote: int = Field(..., alias="lastVote")
     delinquent: bool
 
+    @field_validator("credits", mode="before")
+    @classmethod
+    def parse_epoch_credits(cls, value: Any) -> Any:  # noqa: ANN401
+        """Convert [epoch, credits, previous_credits] triples from the RPC response into EpochCredits fields."""
+        return [{"epoch": c[0], "credits": c[1], "previous_credits": c[2]} if isinstance(c, list) else c for c in value]
+
 
 class BlockProduction(BaseModel):
     """Block production statistics for a slot range."""
@@ -77,15 +85,24 @@ class BlockProduction(BaseModel):
     last_slot: int
     leaders: list[Leader]
 
+    @property
+    def totals(self) -> tuple[int, int]:
+        """Return (produced, skipped) block totals across all leaders."""
+        produced = skipped = 0
+        for leader in self.leaders:
+            produced += leader.produced
+            skipped += leader.skipped
+        return produced, skipped
+
     @property
     def total_produced(self) -> int:
         """Return total blocks produced across all leaders."""
-        return sum(leader.produced for leader in self.leaders)
+        return self.totals[0]
 
     @property
     def total_skipped(self) -> int:
         """Return total blocks skipped across all leaders."""
-        return sum(leader.skipped for leader in self.leaders)
+        return self.totals[1]
 
 
 class StakeActivation(BaseModel):
@@ -96,6 +113,13 @@ class StakeActivation(BaseModel):
     inactive: int
 
 
+_CLUSTER_NODES_ADAPTER = TypeAdapter(list[ClusterNode])
+"""Validator for getClusterNodes responses."""
+
+_VOTE_ACCOUNTS_ADAPTER = TypeAdapter(list[VoteAccount])
+"""Validator for the vote accounts of getVoteAccounts responses."""
+
+
 def rpc_call(
     *,
     node: str,
@@ -112,6 +136,12 @@ def rpc_call(
     raise NotImplementedError("ws is not implemented")
 
 
+def _error_message(response: Any) -> Any:  # noqa: ANN401
+    """Return response["error"]["message"], or None if the response has no error object."""
+    err = response.get("error") if isinstance(response, dict) else None
+    return err.get("message") if isinstance(err, dict) else None
+
+
 def _http_call(node: str, data: dict[str, object], timeout: float, proxy: str | None) -> Result[Any]:
     """Execute a synchronous RPC call over HTTP."""
     res = http_request_sync(node, method="POST", proxy=proxy, timeout=timeout, json=data)
@@ -120,7 +150,7 @@ def _http_call(node: str, data: dict[str, object], timeout: float, proxy: str |
             return res.to_result_err()
 
         json_body = res.json_body().unwrap("invalid_json")
-        err = pydash.get(json_body, "error.message")
+        err = _error_message(json_body)
         if err:
             return res.to_result_err(f"service_error: {err}")
         if "result" in json_body:
@@ -131,6 +161,46 @@ def _http_call(node: str, data: dict[str, object], timeout: float, proxy: str |
         return res.to_result_err(e)
 
 
+def rpc_batch_call(
+    *,
+    node: str,
+    calls: Sequence[tuple[str, list[Any]]],
+    timeout: float = 5,
+    proxy: str | None = None,
+) -> Result[list[Any]]:
+    """Send several JSON-RPC requests to a Solana node in one HTTP POST, returning their results in call order.
+
+    If any call fails, the whole batch is returned as an error.
+    """
+    if not node.startswith("http"):
+        raise NotImplementedError("ws is not implemented")
+
+    data = [{"jsonrpc": "2.0", "method": method, "params": params, "id": i} for i, (method, params) in enumerate(calls)]
+    res = http_request_sync(node, method="POST", proxy=proxy, timeout=timeout, json=data)
+    try:
+        if res.is_err():
+            return res.to_result_err()
+
+        json_body = res.json_body().unwrap("invalid_json")
+        if not isinstance(json_body, list):  # the node rejected the batch as a whole
+            err = _error_message(json_body)
+            return res.to_result_err(f"service_error: {err}" if err else "unknown_response")
+
+        responses = {r.get("id"): r for r in json_body}  # the JSON-RPC spec allows responses in any order
+        results = []
+        for i in range(len(calls)):
+            response = responses.get(i, {})
+            err = _error_message(response)
+            if err:
+                return res.to_result_err(f"service_error: {err}")
+            if "result" not in response:
+                return res.to_result_err("unknown_response")
+            results.append(response["result"])
+        return res.to_result_ok(results)
+    except Exception as e:
+        return res.to_result_err(e)
+
+
 def get_balance(node: str, address: str, timeout: float = 5, proxy: str | None = None) -> Result[int]:
     """Return balance in lamports."""
     return rpc_call(node=node, method="getBalance", params=[address], timeout=timeout, proxy=proxy).map(lambda r: r["value"])
@@ -146,12 +216,25 @@ def get_slot(node: str, timeout: float = 5, proxy: str | None = None) -> Result[
     return rpc_call(node=node, method="getSlot", params=[], timeout=timeout, proxy=proxy)
 
 
+def get_slot_and_block_height(node: str, timeout: float = 5, proxy: str | None = None) -> Result[tuple[int, int]]:
+    """Return the current slot and block height, fetched in a single batched request."""
+    calls: list[tuple[str, list[Any]]] = [("getSlot", []), ("getBlockHeight", [])]
+    return rpc_batch_call(node=node, calls=calls, timeout=timeout, proxy=proxy).map(lambda r: (r[0], r[1]))
+
+
 def get_epoch_info(node: str, epoch: int | None = None, timeout: float = 5, proxy: str | None = None) -> Result[EpochInfo]:
     """Return epoch information, optionally for a specific epoch."""
     params = [epoch] if epoch else []
     return rpc_call(node=node, method="getEpochInfo", params=params, timeout=timeout, proxy=proxy).map(lambda r: EpochInfo(**r))
 
 
+def get_epoch_progress(node: str, timeout: float = 5, proxy: str | None = None) -> Result[float]:
+    """Return current epoch progress as a percentage, without building an EpochInfo model."""
+    return rpc_call(node=node, method="getEpochInfo", params=[], timeout=timeout, proxy=proxy).map(
+        lambda r: round(r["slotIndex"] / r["slotsInEpoch"] * 100, 2),
+    )
+
+
 def get_health(node: str, timeout: float = 5, proxy: str | None = None) -> Result[bool]:
     """Check whether the node is healthy."""
     return rpc_call(node=node, method="getHealth", params=[], timeout=timeout, proxy=proxy).map(lambda r: r == "ok")
@@ -160,7 +243,7 @@ def get_health(node: str, timeout: float = 5, proxy: str | None = None) -> Resul
 def get_cluster_nodes(node: str, timeout: float = 5, proxy: str | None = None) -> Result[list[ClusterNode]]:
     """Return the list of cluster nodes."""
     return rpc_call(node=node, method="getClusterNodes", timeout=timeout, proxy=proxy, params=[]).map(
-        lambda r: [ClusterNode(**n) for n in r],
+        _CLUSTER_NODES_ADAPTER.validate_python,
     )
 
 
@@ -171,40 +254,8 @@ def get_vote_accounts(node: str, timeout: float = 5, proxy: str | None = None) -
         return res
     try:
         data = res.unwrap()
-        result: list[VoteAccount] = []
-        for a in data["current"]:
-            result.append(  # noqa: PERF401
-                VoteAccount(
-                    validator=a["nodePubkey"],
-                    vote=a["votePubkey"],
-                    commission=a["commission"],
-                    stake=a["activatedStake"],
-                    credits=[
-                        VoteAccount.EpochCredits(epoch=c[0], credits=c[1], previous_credits=c[2]) for c in a["epochCredits"]
-                    ],
-                    delinquent=False,
-                    epoch_vote_account=a["epochVoteAccount"],
-                    root_slot=a["rootSlot"],
-                    last_vote=a["lastVote"],
-                ),
-            )
-        for a in data["delinquent"]:
-            result.append(  # noqa: PERF401
-                VoteAccount(
-                    validator=a["nodePubkey"],
-                    vote=a["votePubkey"],
-                    commission=a["commission"],
-                    stake=a["activatedStake"],
-                    credits=[
-                        VoteAccount.EpochCredits(epoch=c[0], credits=c[1], previous_credits=c[2]) for c in a["epochCredits"]
-                    ],
-                    delinquent=True,
-                    epoch_vote_account=a["epochVoteAccount"],
-                    root_slot=a["rootSlot"],
-                    last_vote=a["lastVote"],
-                ),
-            )
-        return res.with_value(result)
+        accounts = [{**a, "delinquent": False} for a in data["current"]] + [{**a, "delinquent": True} for a in data["delinquent"]]
+        return res.with_value(_VOTE_ACCOUNTS_ADAPTER.validate_python(accounts))
     except Exception as e:
         return res.with_error(e)
 
@@ -1,11 +1,26 @@
 """SPL token balance and metadata queries via Solana RPC."""
 
+import base64
+import functools
+from collections.abc import Sequence
+from typing import Any
+
 from mm_result import Result
 from solana.exceptions import SolanaRpcException
 from solana.rpc.core import RPCException
 from solders.solders import InvalidParamsMessage, Pubkey, get_associated_token_address
 
-from mm_sol.utils import get_async_client
+from mm_sol import rpc
+from mm_sol.utils import get_async_client, pubkey
+
+TOKEN_ACCOUNT_AMOUNT_SLICE = (64, 8)
+"""Offset and length of the little-endian u64 amount in the SPL token account layout."""
+
+
+@functools.lru_cache(maxsize=16384)
+def _associated_token_account(owner: str, token: str) -> Pubkey:
+    """Return the associated token account of an owner for a mint."""
+    return get_associated_token_address(pubkey(owner), pubkey(token))
 
 
 async def get_balance(
@@ -20,10 +35,8 @@ async def get_balance(
     response = None
     try:
         client = get_async_client(node, proxy=proxy, timeout=timeout)
-        if not token_account:
-            token_account = str(get_associated_token_address(Pubkey.from_string(owner), Pubkey.from_string(token)))
-
-        res = await client.get_token_account_balance(Pubkey.from_string(token_account))
+        account = pubkey(token_account) if token_account else _associated_token_account(owner, token)
+        res = await client.get_token_account_balance(account)
         response = res.to_json()
 
         # Sometimes it not raise an error, but it returns this :(
@@ -40,12 +53,39 @@ async def get_balance(
         return Result.err(e, {"response": response})
 
 
+async def get_balances(
+    node: str,
+    owners_tokens: Sequence[tuple[str, str]],
+    timeout: float = 5,
+    proxy: str | None = None,
+) -> Result[list[int]]:
+    """Return token balances for many (owner, token) pairs, in input order, using batched getMultipleAccounts calls.
+
+    Associated token accounts are derived locally and only their amount field is requested. Pairs without a token
+    account have a zero balance, as in get_balance.
+    """
+    try:
+        token_accounts = [str(_associated_token_account(owner, token)) for owner, token in owners_tokens]
+    except Exception as e:
+        return Result.err(e)
+    res: Result[Any] = await rpc.get_multiple_accounts(
+        node, token_accounts, data_slice=TOKEN_ACCOUNT_AMOUNT_SLICE, timeout=timeout, proxy=proxy
+    )
+    if res.is_err():
+        return res
+    try:
+        balances = [int.from_bytes(base64.b64decode(a["data"][0]), "little") if a else 0 for a in res.unwrap()]
+        return res.with_value(balances)
+    except Exception as e:
+        return res.with_error(e)
+
+
 async def get_decimals(node: str, token: str, timeout: float = 5, proxy: str | None = None) -> Result[int]:
     """Return the number of decimals for a token mint."""
     response = None
     try:
         client = get_async_client(node, proxy=proxy, timeout=timeout)
-        res = await client.get_token_supply(Pubkey.from_string(token))
+        res = await client.get_token_supply(pubkey(token))
         response = res.to_json()
         return Result.ok(res.value.decimals, {"response": response})
     except Exception as e:
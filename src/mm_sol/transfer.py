@@ -1,8 +1,10 @@
 """SOL and SPL token transfer operations."""
 
-import pydash
+from typing import Any
+
 from mm_result import Result
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from solders.keypair import Keypair
 from solders.message import Message
 from solders.pubkey import Pubkey
 from solders.signature import Signature
@@ -21,7 +23,7 @@ async def transfer_token(
     node: str,
     token_mint_address: str | Pubkey,
     from_address: str | Pubkey,
-    private_key: str,
+    private_key: str | Keypair,
     to_address: str | Pubkey,
     amount: int,  # smallest unit
     decimals: int,
@@ -32,7 +34,7 @@ async def transfer_token(
     """Transfer SPL tokens, optionally creating the recipient's token account."""
     # TODO: try/except this function!!!
     acc = get_keypair(private_key)
-    if not check_private_key(from_address, private_key):
+    if not check_private_key(from_address, acc):
         return Result.err("invalid_private_key")
 
     from_address = utils.pubkey(from_address)
@@ -71,7 +73,7 @@ async def transfer_sol(
     *,
     node: str,
     from_address: str,
-    private_key: str,
+    private_key: str | Keypair,
     to_address: str,
     lamports: int,
     proxy: str | None = None,
@@ -79,13 +81,13 @@ async def transfer_sol(
 ) -> Result[Signature]:
     """Transfer SOL from one account to another."""
     acc = get_keypair(private_key)
-    if not check_private_key(from_address, private_key):
+    if not check_private_key(from_address, acc):
         return Result.err("invalid_private_key")
 
     client = utils.get_async_client(node, proxy=proxy, timeout=timeout)
     data = None
     try:
-        ixs = [transfer(TransferParams(from_pubkey=acc.pubkey(), to_pubkey=Pubkey.from_string(to_address), lamports=lamports))]
+        ixs = [transfer(TransferParams(from_pubkey=acc.pubkey(), to_pubkey=utils.pubkey(to_address), lamports=lamports))]
         msg = Message(ixs, acc.pubkey())
         blockhash = await client.get_latest_blockhash()
         tx = Transaction([acc], msg, blockhash.value.blockhash)
@@ -104,22 +106,30 @@ class SolTransferInfo(BaseModel):
     lamports: int
 
 
+_SOL_TRANSFER_INFOS_ADAPTER = TypeAdapter(list[SolTransferInfo])
+"""Validator for the SOL transfers parsed from a transaction."""
+
+
 def find_sol_transfers(node: str, tx_signature: str) -> Result[list[SolTransferInfo]]:
     """Parse SOL transfer instructions from a transaction signature."""
     res = rpc_sync.get_transaction(node, tx_signature, encoding="jsonParsed")
     if res.is_err():
         return res  # type: ignore[return-value]
-    result = []
+    rows: list[dict[str, Any]] = []
     try:
-        for ix in pydash.get(res.ok, "transaction.message.instructions"):
-            program_id = ix.get("programId")
-            ix_type = pydash.get(ix, "parsed.type")
-            if program_id == "11111111111111111111111111111111" and ix_type == "transfer":
-                source = pydash.get(ix, "parsed.info.source")
-                destination = pydash.get(ix, "parsed.info.destination")
-                lamports = pydash.get(ix, "parsed.info.lamports")
+        tx: Any = res.unwrap()
+        for ix in tx["transaction"]["message"]["instructions"]:
+            # programId is checked first: "parsed" is not a dict for every program (e.g. memo)
+            if ix.get("programId") != "11111111111111111111111111111111":
+                continue
+            parsed = ix.get("parsed", {})
+            if parsed.get("type") == "transfer":
+                info = parsed.get("info", {})
+                source = info.get("source")
+                destination = info.get("destination")
+                lamports = info.get("lamports")
                 if source and destination and lamports:
-                    result.append(SolTransferInfo(source=source, destination=destination, lamports=lamports))
-        return res.with_value(result)
+                    rows.append({"source": source, "destination": destination, "lamports": lamports})
+        return res.with_value(_SOL_TRANSFER_INFOS_ADAPTER.validate_python(rows))
     except Exception as e:
         return Result.err(e, res.context)
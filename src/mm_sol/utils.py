@@ -1,10 +1,28 @@
 """Utility functions for creating Solana RPC clients and converting pubkeys."""
 
+import asyncio
+import functools
+from collections import OrderedDict
+
 from solana.rpc.api import Client
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
 from solders.pubkey import Pubkey
 
+MAX_CACHED_ASYNC_CLIENTS = 64
+"""Maximum number of cached async clients; beyond it the least recently used client is dropped from the cache."""
+
+
+class _AsyncClientCache:
+    """Async clients bound to a single event loop, keyed by client settings."""
+
+    def __init__(self) -> None:
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.clients: OrderedDict[tuple[object, ...], AsyncClient] = OrderedDict()
+
+
+_async_client_cache = _AsyncClientCache()
+
 
 def get_client(
     endpoint: str,
@@ -24,10 +42,47 @@ def get_async_client(
     proxy: str | None = None,
     timeout: float = 10,
 ) -> AsyncClient:
-    """Create an asynchronous Solana RPC client."""
-    return AsyncClient(endpoint, commitment=commitment, extra_headers=extra_headers, timeout=timeout, proxy=proxy)
+    """Return an asynchronous Solana RPC client.
+
+    Inside a running event loop, clients are cached per settings and reused until close_async_clients() is called
+    or another event loop asks for a client. Cached clients must not be closed by callers.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:  # without a running loop there is nothing to bind the cache to
+        return AsyncClient(endpoint, commitment=commitment, extra_headers=extra_headers, timeout=timeout, proxy=proxy)
+
+    cache = _async_client_cache
+    if cache.loop is not loop:
+        # clients of another loop can't be used or closed from this one
+        cache.clients.clear()
+        cache.loop = loop
+
+    key = (endpoint, commitment, tuple(sorted(extra_headers.items())) if extra_headers else None, proxy, timeout)
+    client = cache.clients.get(key)
+    if client is not None:
+        cache.clients.move_to_end(key)
+        return client
+
+    client = AsyncClient(endpoint, commitment=commitment, extra_headers=extra_headers, timeout=timeout, proxy=proxy)
+    cache.clients[key] = client
+    if len(cache.clients) > MAX_CACHED_ASYNC_CLIENTS:
+        # not closed here: a caller may still be awaiting a request on it; its connections go away with the client
+        cache.clients.popitem(last=False)
+    return client
+
+
+async def close_async_clients() -> None:
+    """Close and forget all cached async clients. Call it before the event loop that used them shuts down."""
+    cache = _async_client_cache
+    clients = list(cache.clients.values())
+    cache.clients.clear()
+    cache.loop = None
+    for client in clients:
+        await client.close()
 
 
+@functools.lru_cache(maxsize=4096)
 def pubkey(value: str | Pubkey) -> Pubkey:
     """Convert a string or Pubkey to a Pubkey instance."""
     if isinstance(value, Pubkey):
@@ -113,12 +113,14 @@ def test_get_keypair():
         "[82,64,164,208,0,155,36,201,208,109,43,74,205,156,170,228,146,161,5,178,220,84,195,1,26,161,196,249,242,208,176,186,132,228,144,215,19,161,75,120,161,187,133,19,177,120,198,161,218,5,75,159,126,193,98,18,233,227,129,128,197,153,227,104]",
     )
     assert str(acc.pubkey()) == "9wkxjGXrRhHB9pFZrEpQKBKAJ52jMjVUahnVNezJFvL7"
+    assert get_keypair(acc) is acc
 
 
 def test_get_public_key():
-    """Verify public key derivation from a private key."""
+    """Verify public key derivation from a private key string and a Keypair."""
     private_key = "2eP4yM63zQxBkoF2Rzzmank9AQ2qiPJExxb7AZ95UPxUpHf8XWgYpy7C5ZNy6zU3jj4nYPD1ijK4EzLLZDwkxZXM"
     assert get_public_key(private_key) == "9wkxjGXrRhHB9pFZrEpQKBKAJ52jMjVUahnVNezJFvL7"
+    assert get_public_key(get_keypair(private_key)) == "9wkxjGXrRhHB9pFZrEpQKBKAJ52jMjVUahnVNezJFvL7"
 
 
 def test_get_private_key_base58():
@@ -140,6 +142,9 @@ def test_is_valid_pubkey():
     assert is_address("9nmjQrSpmf51BxcQu6spWD8w4jUzPVrtmtPbDGLyDuan")
     assert is_address("9nmjQrSpmf51BxcQu6spWD8w4jUzPVrtmtPbDGLyDuaN")
     assert not is_address("9nmjQrSpmf51BxcQu6spWD8w4jUzPVrtmtPbDGLyDuama")
+    assert is_address("11111111111111111111111111111111")
+    assert not is_address("")
+    assert not is_address("0nmjQrSpmf51BxcQu6spWD8w4jUzPVrtmtPbDGLyDuan")
 
 
 def test_generate_mnemonic():
@@ -1,9 +1,50 @@
 """Tests for Solana RPC client creation."""
 
-from mm_sol.utils import get_client
+import asyncio
+
+from mm_sol import utils
+from mm_sol.utils import close_async_clients, get_async_client, get_client
+
+DEVNET_URL = "https://api.devnet.solana.com"
 
 
 def test_proxy_client(mainnet_node, random_proxy):
     """Verify client with proxy can fetch block height."""
     client = get_client(mainnet_node, proxy=random_proxy)
     assert client.get_block_height().value > 10_000_000
+
+
+async def test_async_client_is_reused():
+    """Verify async clients are cached per settings within an event loop."""
+    client = get_async_client(DEVNET_URL)
+    assert get_async_client(DEVNET_URL) is client
+    assert get_async_client(DEVNET_URL, timeout=5) is not client
+    await close_async_clients()
+    assert get_async_client(DEVNET_URL) is not client
+    await close_async_clients()
+
+
+def test_async_client_cache_is_per_event_loop():
+    """Verify a new event loop drops the clients cached by the previous one."""
+
+    async def cached_client():
+        return get_async_client(DEVNET_URL)
+
+    first = asyncio.run(cached_client())
+    second = asyncio.run(cached_client())
+    assert second is not first
+    assert list(utils._async_client_cache.clients.values()) == [second]  # noqa: SLF001
+    asyncio.run(close_async_clients())
+
+
+async def test_async_client_cache_is_bounded():
+    """Verify the least recently used client is evicted once the cache is full, but stays usable for its holder."""
+    held = get_async_client(DEVNET_URL, timeout=0)
+    for i in range(1, utils.MAX_CACHED_ASYNC_CLIENTS + 1):
+        get_async_client(DEVNET_URL, timeout=i)
+    assert len(utils._async_client_cache.clients) == utils.MAX_CACHED_ASYNC_CLIENTS  # noqa: SLF001
+    assert held not in utils._async_client_cache.clients.values()  # noqa: SLF001
+    await asyncio.sleep(0)
+    assert not held._provider.session.is_closed  # noqa: SLF001
+    await close_async_clients()
+    await held.close()
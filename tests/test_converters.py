@@ -1,16 +1,26 @@
 """Tests for SOL/lamports/token conversion utilities."""
 
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 import pytest
 
-from mm_sol.converters import lamports_to_sol, sol_to_lamports, to_lamports
+from mm_sol.converters import lamports_to_sol, sol_to_lamports, to_lamports, to_token
 
 
 def test_lamports_to_sol():
     """Verify lamports-to-SOL conversion with rounding."""
     res = lamports_to_sol(272356343007, ndigits=4)
     assert res == Decimal("272.3563")
+    assert lamports_to_sol(123_456_789_012_345_678, ndigits=2) == Decimal("123456789.01")
+
+
+def test_to_token():
+    """Verify smallest-unit-to-token conversion with rounding."""
+    assert to_token(12_345_678, decimals=6) == Decimal("12.3457")
+    assert to_token(12_345_678, decimals=6, ndigits=1) == Decimal("12.3")
+    assert to_token(0, decimals=6) == Decimal(0)
+    assert str(to_token(0, decimals=6)) == str(to_token(1, decimals=9)) == "0.0000"
+    assert to_token(2**64 - 1, decimals=0, ndigits=9) == Decimal(2**64 - 1)
 
 
 def test_sol_to_lamports():
@@ -32,3 +42,14 @@ def test_to_lamports():
         to_lamports(Decimal("123.1"))
     with pytest.raises(ValueError):
         to_lamports("10t")
+
+
+def test_to_lamports_string_parsing():
+    """Verify string normalization, suffix stripping, and rejection of a repeated suffix."""
+    assert to_lamports("123") == 123
+    assert to_lamports(" 2 SOL ") == 2 * 10**9
+    assert to_lamports("1.5 T", decimals=6) == 1_500_000
+    assert to_lamports(" 42 ") == 42
+
+    with pytest.raises(InvalidOperation):
+        to_lamports("1sol2sol")
@@ -0,0 +1,41 @@
+"""Tests for retry wrappers."""
+
+from collections import OrderedDict
+
+import pytest
+from mm_result import Result
+
+from mm_sol import retry, spl_token
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def decimals_calls(monkeypatch):
+    """Replace spl_token.get_decimals with a fake that records calls and fails for unknown tokens."""
+    calls = []
+
+    async def get_decimals(node, token, **_kwargs):
+        calls.append((node, token))
+        return Result.ok(6) if token == "usdt" else Result.err("not_found")
+
+    monkeypatch.setattr(retry, "_token_decimals_cache", OrderedDict())
+    monkeypatch.setattr(spl_token, "get_decimals", get_decimals)
+    return calls
+
+
+async def test_get_token_decimals_cache(decimals_calls):
+    """Verify successful lookups are cached per node set and token."""
+    assert (await retry.get_token_decimals(1, ["http://a"], [], token="usdt")).unwrap() == 6
+    assert (await retry.get_token_decimals(1, ["http://a"], [], token="usdt")).unwrap() == 6
+    assert len(decimals_calls) == 1
+
+    await retry.get_token_decimals(1, ["http://b"], [], token="usdt")
+    assert len(decimals_calls) == 2
+
+
+async def test_get_token_decimals_errors_not_cached(decimals_calls):
+    """Verify failed lookups are retried on the next call."""
+    assert (await retry.get_token_decimals(1, ["http://a"], [], token="unknown")).is_err()
+    assert (await retry.get_token_decimals(1, ["http://a"], [], token="unknown")).is_err()
+    assert len(decimals_calls) == 2
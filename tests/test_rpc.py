@@ -3,6 +3,7 @@
 import pytest
 
 from mm_sol import rpc
+from mm_sol.account import generate_account
 
 pytestmark = pytest.mark.asyncio
 
@@ -11,3 +12,13 @@ async def test_get_balance(mainnet_node, binance_wallet, random_proxy):
     """Verify async balance query returns positive lamports."""
     res = await rpc.get_balance(mainnet_node, binance_wallet, proxy=random_proxy)
     assert res.unwrap() > 10_000_000
+
+
+async def test_get_balances(mainnet_node, binance_wallet, random_proxy):
+    """Verify batched balance query keeps input order and returns zero for unknown accounts."""
+    new_address = generate_account().public_key
+    res = await rpc.get_balances(mainnet_node, [binance_wallet, new_address], proxy=random_proxy)
+    balances = res.unwrap()
+    assert len(balances) == 2
+    assert balances[0] > 10_000_000
+    assert balances[1] == 0
@@ -1,8 +1,64 @@
 """Tests for synchronous Solana RPC client."""
 
+import pytest
+from mm_result import Result
+
 from mm_sol import rpc_sync
 
 
+class _StubResponse:
+    """Stand-in for an mm_http response with a fixed JSON body."""
+
+    def __init__(self, body):
+        self.body = body
+
+    def is_err(self):
+        return False
+
+    def json_body(self):
+        return Result.ok(self.body)
+
+    def to_result_ok(self, value):
+        return Result.ok(value)
+
+    def to_result_err(self, error=None):
+        return Result.err(error)
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ({"result": 123, "error": None}, 123),
+        ({"error": {"code": -32600, "message": "bad request"}}, "service_error: bad request"),
+        ({"error": "bad request"}, "unknown_response"),
+    ],
+)
+def test_rpc_call_error_field(monkeypatch, body, expected):
+    """Verify a null or non-object error field doesn't break response parsing."""
+    monkeypatch.setattr(rpc_sync, "http_request_sync", lambda *_args, **_kwargs: _StubResponse(body))
+    res = rpc_sync.rpc_call(node="http://localhost", method="getSlot", params=[])
+    assert res.value_or_error() == expected
+
+
+def test_block_production_totals():
+    """Verify block production totals are summed across leaders and follow changes to leaders."""
+    bp = rpc_sync.BlockProduction(
+        slot=10,
+        first_slot=1,
+        last_slot=10,
+        leaders=[
+            rpc_sync.BlockProduction.Leader(address="a", produced=3, skipped=1),
+            rpc_sync.BlockProduction.Leader(address="b", produced=2, skipped=4),
+        ],
+    )
+    assert bp.totals == (5, 5)
+    assert bp.total_produced == 5
+    assert bp.total_skipped == 5
+
+    bp.leaders.pop()
+    assert bp.totals == (3, 1)
+
+
 def test_get_balance(mainnet_node, binance_wallet, random_proxy):
     """Verify balance query returns positive lamports."""
     res = rpc_sync.get_balance(mainnet_node, binance_wallet, proxy=random_proxy)
@@ -15,6 +71,16 @@ def test_get_block_height(mainnet_node, random_proxy):
     assert res.unwrap() > 10_000_000
 
 
+def test_rpc_batch_call(mainnet_node, random_proxy):
+    """Verify batched calls return one result per call in call order."""
+    res = rpc_sync.rpc_batch_call(
+        node=mainnet_node, calls=[("getSlot", []), ("getHealth", []), ("getBlockHeight", [])], proxy=random_proxy
+    )
+    slot, health, block_height = res.unwrap()
+    assert slot > block_height > 10_000_000
+    assert health == "ok"
+
+
 def test_get_slot(testnet_node, random_proxy):
     """Verify slot query returns a positive number."""
     res = rpc_sync.get_slot(testnet_node, proxy=random_proxy)
@@ -27,6 +93,19 @@ def test_get_epoch_info(testnet_node, random_proxy):
     assert res.unwrap().epoch > 500
 
 
+def test_get_epoch_progress(testnet_node, random_proxy):
+    """Verify epoch progress is a percentage."""
+    res = rpc_sync.get_epoch_progress(testnet_node, proxy=random_proxy)
+    assert 0 <= res.unwrap() <= 100
+
+
+def test_get_slot_and_block_height(mainnet_node, random_proxy):
+    """Verify slot and block height are fetched together."""
+    res = rpc_sync.get_slot_and_block_height(mainnet_node, proxy=random_proxy)
+    slot, block_height = res.unwrap()
+    assert slot > block_height > 10_000_000
+
+
 def test_get_health(mainnet_node, testnet_node, random_proxy):
     """Verify health check returns True for mainnet and testnet."""
     res = rpc_sync.get_health(mainnet_node, proxy=random_proxy)
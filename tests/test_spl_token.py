@@ -21,6 +21,21 @@ async def test_get_balance_no_token_account(mainnet_node, usdt_token_address, ra
     assert res.unwrap() == 0
 
 
+async def test_get_balances(mainnet_node, usdt_token_address, usdt_owner_address, random_proxy):
+    """Verify batched token balances keep input order and return zero for missing token accounts."""
+    owners_tokens = [(usdt_owner_address, usdt_token_address), (generate_account().public_key, usdt_token_address)]
+    res = await spl_token.get_balances(mainnet_node, owners_tokens, proxy=random_proxy)
+    balances = res.unwrap()
+    assert balances[0] > 0
+    assert balances[1] == 0
+
+
+async def test_get_balances_invalid_address():
+    """Verify an invalid owner address is returned as an error instead of raised."""
+    res = await spl_token.get_balances("http://localhost", [("not-a-key", "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB")])
+    assert res.is_err()
+
+
 async def test_get_decimals(mainnet_node, usdt_token_address, random_proxy):
     """Verify USDT token has 6 decimals."""
     res = await spl_token.get_decimals(mainnet_node, usdt_token_address, proxy=random_proxy)
@@ -0,0 +1,33 @@
+"""Tests for SOL and SPL token transfer operations."""
+
+from mm_result import Result
+
+from mm_sol import rpc_sync, transfer
+from mm_sol.transfer import SolTransferInfo
+
+SYSTEM_PROGRAM_ID = "11111111111111111111111111111111"
+MEMO_PROGRAM_ID = "MemoSq4gqABAXKb96qnH8TysNcWxMyWCqXgDLGmfcHr"
+
+
+def test_find_sol_transfers(monkeypatch):
+    """Verify only system program transfer instructions are returned."""
+    tx = {
+        "transaction": {
+            "message": {
+                "instructions": [
+                    {
+                        "programId": SYSTEM_PROGRAM_ID,
+                        "parsed": {"type": "transfer", "info": {"source": "src", "destination": "dst", "lamports": 5000}},
+                    },
+                    {"programId": MEMO_PROGRAM_ID, "parsed": "hello"},
+                    {
+                        "programId": SYSTEM_PROGRAM_ID,
+                        "parsed": {"type": "advanceNonce", "info": {"nonceAccount": "nonce", "nonceAuthority": "auth"}},
+                    },
+                ]
+            }
+        }
+    }
+    monkeypatch.setattr(rpc_sync, "get_transaction", lambda *_args, **_kwargs: Result.ok(tx))
+    res = transfer.find_sol_transfers("http://localhost", "signature")
+    assert res.unwrap() == [SolTransferInfo(source="src", destination="dst", lamports=5000)]